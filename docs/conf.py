@@ -62,9 +62,30 @@ base_url = "https://github.com/bentheiii/envolved"  # The base url of the reposi
 root_dir = Path(find_spec(project).submodule_search_locations[0])
 
 
+# sphinx may resolve the same object multiple times, so we cache the links by module and name
+_linkcode_cache = {}
+
+
 def linkcode_resolve(domain, info):
     if domain != "py":
         return None
+    cache_key = (info["module"], info["fullname"])
+    if cache_key not in _linkcode_cache:
+        _linkcode_cache[cache_key] = _resolve_link(info)
+    return _linkcode_cache[cache_key]
+
+
+# parsing a source file is expensive, and most files contain many documented objects
+_node_walk_cache = {}
+
+
+def _node_walk(package_file):
+    if package_file not in _node_walk_cache:
+        _node_walk_cache[package_file] = NodeWalk.from_file(package_file)
+    return _node_walk_cache[package_file]
+
+
+def _resolve_link(info):
     try:
         package_file = root_dir / (info["module"].replace(".", "/") + ".py")
         if not package_file.exists():
@@ -72,7 +93,7 @@ def linkcode_resolve(domain, info):
             if not package_file.exists():
                 raise FileNotFoundError
         blob = project / Path(package_file).relative_to(root_dir)
-        walk = NodeWalk.from_file(package_file)
+        walk = _node_walk(package_file)
         try:
             decl = walk.get_last(info["fullname"])
         except KeyError:
@@ -1,9 +1,14 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Tuple
+
 from envolved._version import __version__
-from envolved.absolute_name import AbsoluteName
-from envolved.describe import describe_env_vars
-from envolved.envvar import EnvVar, Factory, as_default, discard, env_var, inferred_env_var, missing, no_patch
-from envolved.exceptions import MissingEnvError
-from envolved.factory_spec import Env
+
+if TYPE_CHECKING:
+    from envolved.absolute_name import AbsoluteName
+    from envolved.describe import describe_env_vars
+    from envolved.envvar import EnvVar, Factory, as_default, discard, env_var, inferred_env_var, missing, no_patch
+    from envolved.exceptions import MissingEnvError
+    from envolved.factory_spec import Env
 
 __all__ = [
     "__version__",
@@ -20,3 +25,53 @@ __all__ = [
     "AbsoluteName",
     "Env",
 ]
+
+# public names are resolved from their submodules on first access, so that importing envolved only loads what is used
+_lazy_attributes: Dict[str, Tuple[str, str]] = {
+    "EnvVar": ("envolved.envvar", "EnvVar"),
+    "MissingEnvError": ("envolved.exceptions", "MissingEnvError"),
+    "as_default": ("envolved.envvar", "as_default"),
+    "describe_env_vars": ("envolved.describe", "describe_env_vars"),
+    "discard": ("envolved.envvar", "discard"),
+    "env_var": ("envolved.envvar", "env_var"),
+    "inferred_env_var": ("envolved.envvar", "inferred_env_var"),
+    "missing": ("envolved.envvar", "missing"),
+    "no_patch": ("envolved.envvar", "no_patch"),
+    "Factory": ("envolved.envvar", "Factory"),
+    "AbsoluteName": ("envolved.absolute_name", "AbsoluteName"),
+    "Env": ("envolved.factory_spec", "Env"),
+}
+
+
+# submodules were bound as attributes by eager imports, so they remain accessible as attributes after importing envolved
+_lazy_submodules: FrozenSet[str] = frozenset(
+    (
+        "absolute_name",
+        "basevar",
+        "describe",
+        "envparser",
+        "envvar",
+        "exceptions",
+        "factory_spec",
+        "infer_env_var",
+        "parsers",
+        "utils",
+    )
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_submodules:
+        # importing a submodule binds it as an attribute of the package
+        return import_module(f"{__name__}.{name}")
+    try:
+        module_name, attr_name = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
@@ -3,6 +3,7 @@ class AbsoluteName(str):
 
 
 def with_prefix(prefix: str, name: str) -> str:
-    if isinstance(name, AbsoluteName):
-        return name
-    return prefix + name
+    # plain str names are by far the most common, so we check for them first
+    if type(name) is str or not isinstance(name, AbsoluteName):
+        return prefix + name
+    return name
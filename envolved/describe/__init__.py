@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from itertools import chain
-from typing import Any, Iterable, List, Mapping, Set, TypeVar, Union
+from typing import Any, Iterable, Iterator, List, Mapping, Set, TypeVar, Union
 
 from envolved.describe.flat import FlatEnvVarsDescription
 from envolved.describe.nested import NestedEnvVarsDescription, RootNestedDescription
@@ -16,24 +15,25 @@ def describe_env_vars(**kwargs: Any) -> List[str]:
 
 class EnvVarsDescription:
     def __init__(self, env_vars: Iterable[EnvVar] | None = None) -> None:
-        self.env_var_roots = set()
-        children: Set[EnvVar] = set()
-
         if env_vars is None:
-            env_vars = all_env_vars
-            to_exclude = roots_to_exclude_from_description | set(
-                chain.from_iterable(r._get_descendants() for r in roots_to_exclude_from_description)
-            )
-        else:
-            to_exclude = set()
+            # the registered env vars are checked as they are now, since a parent may have been collected since its
+            # children were registered, schema env vars cache their descendants so this is cheap
+            self.env_var_roots = set(all_env_vars)
+            for env_var in tuple(self.env_var_roots):
+                self.env_var_roots.difference_update(env_var._get_descendants())
+            self.env_var_roots -= env_vars_to_exclude_from_description
+            return
 
+        self.env_var_roots = set()
+        non_roots: Set[EnvVar] = set()
         for env_var in env_vars:
+            if env_var in non_roots or env_var in self.env_var_roots:
+                # we've already marked this env var's descendants
+                continue
             self.env_var_roots.add(env_var)
-            children.update(env_var._get_descendants())
-        # remove any children we found along the way
-        self.env_var_roots -= children
-        # remove any children we were asked to exclude
-        self.env_var_roots -= to_exclude
+            for descendant in env_var._get_descendants():
+                non_roots.add(descendant)
+                self.env_var_roots.discard(descendant)
 
     def flat(self) -> FlatEnvVarsDescription:
         return FlatEnvVarsDescription.from_envvars(self.env_var_roots)
@@ -48,19 +48,31 @@ T = TypeVar(
 )
 
 roots_to_exclude_from_description: Set[EnvVar] = set()
+# the excluded roots, along with all their descendants
+env_vars_to_exclude_from_description: Set[EnvVar] = set()
 
 
-def exclude_from_description(to_exclude: T) -> T:
+def _flatten_exclusion(to_exclude: Any) -> Iterator[EnvVar]:
     if isinstance(to_exclude, EnvVar):
-        roots_to_exclude_from_description.add(to_exclude)
+        yield to_exclude
     elif isinstance(to_exclude, Mapping):
-        exclude_from_description(to_exclude.values())
+        yield from _flatten_exclusion(to_exclude.values())
     elif isinstance(to_exclude, Iterable):
         for v in to_exclude:
-            exclude_from_description(v)
+            yield from _flatten_exclusion(v)
     elif isinstance(to_exclude, InferEnvVar):
         pass
     else:
         raise TypeError(f"cannot exclude unrecognized type {type(to_exclude)!r}")
 
+
+def exclude_from_description(to_exclude: T) -> T:
+    # we flatten the input entirely before excluding anything, so that invalid inputs don't cause partial exclusions
+    new_roots = set(_flatten_exclusion(to_exclude))
+    new_roots -= roots_to_exclude_from_description
+    for root in new_roots:
+        roots_to_exclude_from_description.add(root)
+        env_vars_to_exclude_from_description.add(root)
+        env_vars_to_exclude_from_description.update(root._get_descendants())
+
     return to_exclude
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from itertools import chain, groupby
-from typing import Any, Iterable, List, Tuple
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from warnings import warn
 
-from envolved.describe.util import prefix_description, wrap_description as wrap
-from envolved.envvar import Description, EnvVar, SingleEnvVar
+from envolved.describe.util import min_descendant_key, wrap_single_env_var
+from envolved.envvar import EnvVar, SingleEnvVar
 
 
 @dataclass
@@ -16,21 +16,12 @@ class SingleEnvVarDescription:
 
     @property
     def key(self) -> str:
-        key = self.env_var.key
-        if not self.env_var.case_sensitive:
-            key = key.upper()
-
-        return key
+        if self.env_var.case_sensitive:
+            return self.env_var.key
+        return self.env_var._upper_key
 
     def wrap(self, **kwargs: Any) -> Iterable[str]:
-        text: Description
-        if self.env_var.description is None:
-            text = self.key
-        else:
-            text = prefix_description(self.key + ": ", self.env_var.description)
-            subsequent_indent_increment = len(self.key) + 2
-            kwargs["subsequent_indent"] = kwargs.get("subsequent_indent", "") + " " * subsequent_indent_increment
-        return wrap(text, **kwargs)
+        return wrap_single_env_var(self.key, self.env_var, **kwargs)
 
     @classmethod
     def from_envvar(cls, path: Tuple[str, ...], env_var: EnvVar) -> Iterable[SingleEnvVarDescription]:
@@ -38,15 +29,12 @@ class SingleEnvVarDescription:
             yield cls(
                 (
                     *path,
-                    env_var.key.upper(),
+                    env_var._upper_key,
                 ),
                 env_var,
             )
         else:
-            min_child = min(
-                (e.key.upper() for e in env_var._get_descendants() if isinstance(e, SingleEnvVar)),
-                default=None,
-            )
+            min_child = min_descendant_key(env_var)
             if min_child is not None:
                 path = (*path, min_child)
             for child in env_var._get_children():
@@ -58,54 +46,67 @@ class SingleEnvVarDescription:
         assert len({i.env_var.key for i in instances}) == 1
         # in case of conflict we choose arbitrarily, with a warning
         # first we prefer an env var with a description, if one exists
-        with_description = []
-        without_description = []
+        first_with_description = None
+        first_without_description = None
         for instance in instances:
-            if instance.env_var.description is None:
-                without_description.append(instance)
-            else:
-                with_description.append(instance)
-
-        if with_description:
-            if len(with_description) > 1 and len({i.env_var.description for i in with_description}) > 1:
+            description = instance.env_var.description
+            if description is None:
+                if first_without_description is None:
+                    first_without_description = instance
+            elif first_with_description is None:
+                first_with_description = instance
+            # descriptions may be lists, so we compare them by equality rather than by hashing
+            elif description != first_with_description.env_var.description:
                 warn(
-                    f"multiple descriptions for env var {with_description[0].env_var.key!r}, choosing arbitrarily",
+                    f"multiple descriptions for env var {first_with_description.env_var.key!r}, choosing arbitrarily",
                     stacklevel=2,
                 )
-            return with_description[0]
-        else:
-            return without_description[0]
+                # the choice won't change anymore
+                return first_with_description
+
+        if first_with_description is not None:
+            return first_with_description
+        assert first_without_description is not None
+        return first_without_description
 
 
 class FlatEnvVarsDescription:
     def __init__(self, env_var_descriptions: Iterable[SingleEnvVarDescription]) -> None:
-        self.env_var_descriptions = env_var_descriptions
+        self.env_var_descriptions = list(env_var_descriptions)
+        # the sorted orders are computed on first use, and reused by later calls
+        self._groups_by_key: Optional[List[Sequence[SingleEnvVarDescription]]] = None
+        self._sorted_by_path: Optional[List[SingleEnvVarDescription]] = None
 
     def wrap_sorted(self, *, unique_keys: bool = True, **kwargs: Any) -> Iterable[str]:
-        def key(i: SingleEnvVarDescription) -> str:
-            return i.key.upper()
-
-        env_var_descriptions = sorted(self.env_var_descriptions, key=key)
+        groups = self._groups_by_key
+        if groups is None:
+            # we bucket the descriptions by key, so that only the distinct keys need to be sorted
+            buckets: Dict[str, List[SingleEnvVarDescription]] = {}
+            for d in self.env_var_descriptions:
+                buckets.setdefault(d.env_var._upper_key, []).append(d)
+            groups = self._groups_by_key = [buckets[k] for k in sorted(buckets)]
 
         ret: List[str] = []
 
-        for _, group in groupby(env_var_descriptions, key=key):
-            g = tuple(group)
+        for g in groups:
             if len(g) > 1 and unique_keys:
                 ret.extend(SingleEnvVarDescription.collate(g).wrap(**kwargs))
             else:
-                ret.extend(chain.from_iterable(i.wrap(**kwargs) for i in g))
+                for i in g:
+                    ret.extend(i.wrap(**kwargs))
 
         return ret
 
     def wrap_grouped(self, **kwargs: Any) -> Iterable[str]:
-        env_var_descriptions = sorted(self.env_var_descriptions, key=lambda i: (i.path, i.env_var.key))
-        ret = list(
-            chain.from_iterable(
-                chain.from_iterable(d.wrap(**kwargs) for d in group)
-                for _, group in groupby(env_var_descriptions, key=lambda i: i.path)
+        env_var_descriptions = self._sorted_by_path
+        if env_var_descriptions is None:
+            env_var_descriptions = self._sorted_by_path = sorted(
+                self.env_var_descriptions, key=lambda i: (i.path, i.env_var.key)
             )
-        )
+        # the descriptions are already sorted by path, so the groups are simply consecutive
+        ret: List[str] = []
+        for d in env_var_descriptions:
+            ret.extend(d.wrap(**kwargs))
         return ret
 
     @classmethod
@@ -2,9 +2,17 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Iterable, Optional, Tuple
-
-from envolved.describe.util import prefix_description, suffix_description, wrap_description as wrap
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from envolved.describe.util import (
+    description_cache_key,
+    memoized_wrap,
+    min_descendant_key,
+    suffix_description,
+    wrap_description as wrap,
+    wrap_single_env_var,
+)
 from envolved.envvar import Description, EnvVar, SchemaEnvVar, SingleEnvVar
 
 
@@ -18,17 +26,14 @@ class NestedEnvVarsDescription(ABC):
     @classmethod
     def from_env_var(cls, path: Tuple[str, ...], env_var: EnvVar) -> NestedEnvVarsDescription:
         if isinstance(env_var, SingleEnvVar):
-            path = (*path, env_var.key.upper())
+            path = (*path, env_var._upper_key)
             return SingleNestedDescription(path, env_var)
         else:
             assert isinstance(env_var, SchemaEnvVar)
-            min_child = min(
-                (e.key.upper() for e in env_var._get_descendants() if isinstance(e, SingleEnvVar)),
-                default=None,
-            )
+            min_child = min_descendant_key(env_var)
             if min_child is not None:
                 path = (*path, min_child)
-            children = [cls.from_env_var(path, child) for child in env_var._get_children()]
+            children = sort_by_path(cls.from_env_var(path, child) for child in env_var._get_children())
             return SchemaNestedDescription(path, env_var, children)
 
 
@@ -39,41 +44,59 @@ class SingleNestedDescription(NestedEnvVarsDescription):
 
     @property
     def key(self) -> str:
-        key = self.env_var.key
-        if not self.env_var.case_sensitive:
-            key = key.upper()
-
-        return key
+        if self.env_var.case_sensitive:
+            return self.env_var.key
+        return self.env_var._upper_key
 
     def get_path(self) -> Tuple[str, ...]:
         return self.path
 
     def wrap(self, *, indent_increment: str, **kwargs: Any) -> Iterable[str]:
-        text: Description
-        if self.env_var.description is None:
-            text = self.key
-        else:
-            prefix = self.key + ": "
-            text = prefix_description(prefix, self.env_var.description)
-            subsequent_indent_increment = len(prefix)
-            kwargs["subsequent_indent"] = kwargs.get("subsequent_indent", "") + " " * subsequent_indent_increment
-        return wrap(text, **kwargs)
+        return wrap_single_env_var(self.key, self.env_var, **kwargs)
+
+
+def sort_by_path(descriptions: Iterable[NestedEnvVarsDescription]) -> List[NestedEnvVarsDescription]:
+    # only the root description has no path attribute, and it is never sorted
+    return sorted(descriptions, key=attrgetter("path"))
 
 
 class NestedDescriptionWithChildren(NestedEnvVarsDescription):
+    # the children are expected to be sorted by path
     children: Iterable[NestedEnvVarsDescription]
 
     @abstractmethod
     def title(self) -> Description | None: ...
 
-    def wrap(self, *, indent_increment: str, **kwargs: Any) -> Iterable[str]:
+    def wrap_title(self, **kwargs: Any) -> Iterable[str] | None:
         title = self.title()
-        if title is not None:
-            yield from wrap(title, **kwargs)
-            kwargs["subsequent_indent"] = kwargs.get("subsequent_indent", "") + indent_increment
-            kwargs["initial_indent"] = kwargs.get("initial_indent", "") + indent_increment
-        for child in sorted(self.children, key=lambda i: i.get_path()):
-            yield from child.wrap(indent_increment=indent_increment, **kwargs)
+        if title is None:
+            return None
+        return wrap(title, **kwargs)
+
+    def wrap(self, *, indent_increment: str, **kwargs: Any) -> Iterable[str]:
+        # we traverse the tree iteratively, the wrapping arguments are built once per indentation level
+        levels: List[Dict[str, Any]] = [kwargs]
+        stack: List[Tuple[NestedEnvVarsDescription, int]] = [(self, 0)]
+        while stack:
+            node, level = stack.pop()
+            level_kwargs = levels[level]
+            if not isinstance(node, NestedDescriptionWithChildren):
+                yield from node.wrap(indent_increment=indent_increment, **level_kwargs)
+                continue
+            title_lines = node.wrap_title(**level_kwargs)
+            if title_lines is not None:
+                yield from title_lines
+                level += 1
+                if level == len(levels):
+                    levels.append(
+                        {
+                            **level_kwargs,
+                            "subsequent_indent": level_kwargs.get("subsequent_indent", "") + indent_increment,
+                            "initial_indent": level_kwargs.get("initial_indent", "") + indent_increment,
+                        }
+                    )
+            # the stack is popped from the end, so we push the children in reverse order
+            stack.extend((child, level) for child in reversed(tuple(node.children)))
 
 
 @dataclass
@@ -91,6 +114,12 @@ class SchemaNestedDescription(NestedDescriptionWithChildren):
         else:
             return suffix_description(self.env_var.description, ":")
 
+    def wrap_title(self, **kwargs: Any) -> Iterable[str] | None:
+        title = self.title()
+        assert title is not None
+        cache_key = (description_cache_key(self.env_var.description), tuple(sorted(kwargs.items())))
+        return memoized_wrap(self.env_var, cache_key, lambda: wrap(title, **kwargs))
+
 
 @dataclass
 class RootNestedDescription(NestedDescriptionWithChildren):
@@ -104,7 +133,7 @@ class RootNestedDescription(NestedDescriptionWithChildren):
 
     @classmethod
     def from_envvars(cls, env_vars: Iterable[EnvVar]) -> RootNestedDescription:
-        return cls([NestedEnvVarsDescription.from_env_var((), env_var) for env_var in env_vars])
+        return cls(sort_by_path(NestedEnvVarsDescription.from_env_var((), env_var) for env_var in env_vars))
 
     def wrap(self, *, indent_increment: Optional[str] = None, **kwargs: Any) -> Iterable[str]:
         if indent_increment is None:
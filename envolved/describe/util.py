@@ -1,19 +1,37 @@
-from textwrap import wrap
-from typing import Any, Iterable
+from functools import lru_cache
+from textwrap import TextWrapper
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+from weakref import WeakKeyDictionary
 
-from envolved.envvar import Description
+from envolved.envvar import Description, EnvVar, SingleEnvVar
 
 
-def wrap_description(description: Description, **kwargs: Any) -> Iterable[str]:
+@lru_cache(maxsize=32)
+def _text_wrapper(kwargs_items: Tuple[Tuple[str, Any], ...]) -> TextWrapper:
+    return TextWrapper(**dict(kwargs_items))
+
+
+def text_wrapper(**kwargs: Any) -> TextWrapper:
+    """
+    Get a TextWrapper for the given arguments, reusing a previously created one if possible.
+    """
+    return _text_wrapper(tuple(sorted(kwargs.items())))
+
+
+def wrap_description(description: Description, **kwargs: Any) -> List[str]:
+    wrapper = text_wrapper(**kwargs)
     if isinstance(description, str):
-        yield from wrap(description, **kwargs)
-    else:
-        is_first_paragraph = True
-        for line in description:
-            yield from wrap(line, **kwargs)
-            if is_first_paragraph:
-                kwargs["initial_indent"] = kwargs.get("subsequent_indent", "")
-                is_first_paragraph = False
+        return wrapper.wrap(description)
+    ret: List[str] = []
+    is_first_paragraph = True
+    for line in description:
+        ret.extend(wrapper.wrap(line))
+        if is_first_paragraph:
+            # all paragraphs after the first are wrapped without the initial indent
+            kwargs["initial_indent"] = kwargs.get("subsequent_indent", "")
+            wrapper = text_wrapper(**kwargs)
+            is_first_paragraph = False
+    return ret
 
 
 def prefix_description(prefix: str, description: Description) -> Description:
@@ -32,3 +50,65 @@ def suffix_description(description: Description, suffix: str) -> Description:
         return [*description[:-1], description[-1].rstrip() + suffix]
     else:
         return suffix
+
+
+# an env var's descendants never change, so their minimal key can be cached indefinitely
+_min_descendant_key_cache: "WeakKeyDictionary[EnvVar, Optional[str]]" = WeakKeyDictionary()
+
+
+def min_descendant_key(env_var: EnvVar) -> Optional[str]:
+    """
+    The minimal uppercased key of all the single env vars that descend from an env var, or None if there are none.
+    """
+    try:
+        return _min_descendant_key_cache[env_var]
+    except KeyError:
+        pass
+    ret = None
+    for child in env_var._get_children():
+        child_key = child._upper_key if isinstance(child, SingleEnvVar) else min_descendant_key(child)
+        if child_key is not None and (ret is None or child_key < ret):
+            ret = child_key
+    _min_descendant_key_cache[env_var] = ret
+    return ret
+
+
+# wrapped lines of env vars, the cache keys include all the mutable attributes that affect the output
+_env_var_wrap_cache: "WeakKeyDictionary[EnvVar, Dict[Hashable, Sequence[str]]]" = WeakKeyDictionary()
+
+
+def description_cache_key(description: Optional[Description]) -> Hashable:
+    if description is None or isinstance(description, str):
+        return description
+    return tuple(description)
+
+
+def memoized_wrap(env_var: EnvVar, cache_key: Hashable, wrap_func: Callable[[], Iterable[str]]) -> Sequence[str]:
+    """
+    Wrap the description of an env var, reusing the previous result if it was already wrapped with the same cache key.
+    """
+    env_var_cache = _env_var_wrap_cache.get(env_var)
+    if env_var_cache is None:
+        env_var_cache = _env_var_wrap_cache[env_var] = {}
+    else:
+        cached = env_var_cache.get(cache_key)
+        if cached is not None:
+            return cached
+    ret = env_var_cache[cache_key] = tuple(wrap_func())
+    return ret
+
+
+def wrap_single_env_var(key: str, env_var: SingleEnvVar, **kwargs: Any) -> Sequence[str]:
+    description = env_var.description
+
+    def wrap_func() -> Iterable[str]:
+        text: Description
+        if description is None:
+            text = key
+        else:
+            prefix = key + ": "
+            text = prefix_description(prefix, description)
+            kwargs["subsequent_indent"] = kwargs.get("subsequent_indent", "") + " " * len(prefix)
+        return wrap_description(text, **kwargs)
+
+    return memoized_wrap(env_var, (key, description_cache_key(description), tuple(sorted(kwargs.items()))), wrap_func)
@@ -2,7 +2,7 @@ import sys
 from abc import ABC, abstractmethod
 from os import environ, getenv, name
 from threading import Lock
-from typing import Any, MutableMapping, Set, Tuple, Type
+from typing import Any, Dict, MutableMapping, Optional, Set, Tuple, Type
 
 
 class CaseInsensitiveAmbiguityError(Exception):
@@ -30,32 +30,50 @@ class BaseEnvParser(ABC):
         Should raise KeyError if missing, and AmbiguiyError if there are multiple case-insensitive matches
         """
 
+    def normalize_key(self, key: str) -> str:
+        """
+        The normalized form of a key, as should be passed to get_case_insensitive
+        """
+        return key
+
+    def get_case_insensitive(self, key: str, normalized_key: str) -> str:
+        """
+        A case-insensitive get, for callers that have already computed the key's normalized form
+        """
+        return self.get(False, key)
+
 
 # on windows, we are always case insensitive
 class CaseInsensitiveEnvParser(BaseEnvParser):
     def get(self, case_sensitive: bool, key: str) -> str:
         return getenv_unsafe(key.upper())
 
+    def normalize_key(self, key: str) -> str:
+        return key.upper()
+
+    def get_case_insensitive(self, key: str, normalized_key: str) -> str:
+        return getenv_unsafe(normalized_key)
+
 
 class ReloadingEnvParser(BaseEnvParser, ABC):
-    environ_case_insensitive: MutableMapping[str, Set[str]]
+    # built lazily, since many programs never need a case-insensitive lookup that isn't an exact match
+    environ_case_insensitive: Optional[MutableMapping[str, Set[str]]]
 
-    def reload(self):
+    def reload(self) -> None:
         if self.lock.locked():
             # if the lock is already held by someone, we don't need to do any work, just wait until they're done
             with self.lock:
                 return
         with self.lock:
-            self.environ_case_insensitive = {}
+            environ_case_insensitive: Dict[str, Set[str]] = {}
             for k in environ.keys():
-                lower = k.lower()
-                if lower not in self.environ_case_insensitive:
-                    self.environ_case_insensitive[lower] = set()
-                self.environ_case_insensitive[lower].add(k)
+                # the lowered keys are interned, so that lookups with interned normalized keys can match by identity
+                environ_case_insensitive.setdefault(sys.intern(k.lower()), set()).add(k)
+            self.environ_case_insensitive = environ_case_insensitive
 
     def __init__(self):
         self.lock = Lock()
-        self.reload()
+        self.environ_case_insensitive = None
 
 
 class AuditingEnvParser(ReloadingEnvParser):
@@ -64,58 +82,76 @@ class AuditingEnvParser(ReloadingEnvParser):
         sys.addaudithook(self.audit_hook)
 
     def audit_hook(self, event: str, args: Tuple[Any, ...]):
+        # this hook runs for every audit event in the process, so we bail out as early as we can
         if event == "os.putenv":
-            if not args:
-                return
-            key = args[0]
-            if isinstance(key, bytes):
-                try:
-                    key = key.decode("ascii")
-                except UnicodeDecodeError:
-                    return
-            elif not isinstance(key, str):
-                return
-            lower = key.lower()
-            with self.lock:
-                if lower not in self.environ_case_insensitive:
-                    self.environ_case_insensitive[lower] = set()
-                self.environ_case_insensitive[lower].add(key)
+            is_set = True
         elif event == "os.unsetenv":
-            if not args:
+            is_set = False
+        else:
+            return
+        if not args:
+            return
+        key = args[0]
+        if isinstance(key, bytes):
+            try:
+                key = key.decode("ascii")
+            except UnicodeDecodeError:
                 return
-            key = args[0]
-            if isinstance(key, bytes):
-                try:
-                    key = key.decode("ascii")
-                except UnicodeDecodeError:
-                    return
-            elif not isinstance(key, str):
+        elif not isinstance(key, str):
+            return
+        lower = key.lower()
+        if is_set:
+            with self.lock:
+                if self.environ_case_insensitive is not None:
+                    self.environ_case_insensitive.setdefault(sys.intern(lower), set()).add(key)
+        else:
+            # unsetting a key we don't know of is a no-op, so we can check for it without the lock, if the map is
+            # replaced in the meantime, the worst case is a stale key, which get_case_insensitive recovers from
+            environ_case_insensitive = self.environ_case_insensitive
+            if environ_case_insensitive is None or lower not in environ_case_insensitive:
                 return
-            lower = key.lower()
             with self.lock:
-                if lower in self.environ_case_insensitive:
-                    self.environ_case_insensitive[lower].discard(key)
+                # the map may have been replaced since, but it is never unset once built
+                environ_case_insensitive = self.environ_case_insensitive
+                assert environ_case_insensitive is not None
+                candidates = environ_case_insensitive.get(lower)
+                if candidates is not None:
+                    candidates.discard(key)
 
     def get(self, case_sensitive: bool, key: str) -> str:
         if case_sensitive:
             return getenv_unsafe(key)
-
-        lowered = key.lower()
-        candidates = self.environ_case_insensitive[lowered]  # will raise KeyError if not found
-        if not candidates:
-            raise KeyError(key)
-        if key in candidates:
-            preferred_key = key
-        elif len(candidates) == 1:
-            (preferred_key,) = candidates
-        else:
-            raise CaseInsensitiveAmbiguityError(candidates)
-        ret = getenv(preferred_key)
-        if ret is None:
+        return self.get_case_insensitive(key, key.lower())
+
+    def normalize_key(self, key: str) -> str:
+        return sys.intern(key.lower())
+
+    def get_case_insensitive(self, key: str, normalized_key: str) -> str:
+        # we retry after every reload, looping rather than recursing
+        while True:
+            # an exact match is always preferred, and is by far the most common case
+            ret = getenv(key)
+            if ret is not None:
+                return ret
+            environ_case_insensitive = self.environ_case_insensitive
+            if environ_case_insensitive is None:
+                self.reload()
+                continue
+            candidates = environ_case_insensitive[normalized_key]  # will raise KeyError if not found
+            if not candidates:
+                raise KeyError(key)
+            if key in candidates:
+                # the exact key was in the map, but not in the environment, so the map is out of date
+                preferred_key = key
+            elif len(candidates) == 1:
+                (preferred_key,) = candidates
+            else:
+                raise CaseInsensitiveAmbiguityError(candidates)
+            ret = getenv(preferred_key)
+            if ret is not None:
+                return ret
             # someone messed with the env without triggering the auditing hook
             self.reload()
-            return self.get(case_sensitive, key)
-        return ret
 
 
 EnvParser: Type[BaseEnvParser]
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 import sys
-from _weakrefset import WeakSet
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import lru_cache
 from itertools import chain
-from types import MappingProxyType
+from os import getenv
+from types import FunctionType, MappingProxyType
 from typing import (
     Any,
     Callable,
     Dict,
     Generic,
+    Hashable,
     Iterable,
     Iterator,
     List,
@@ -21,11 +23,14 @@ from typing import (
     NoReturn,
     Optional,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
     overload,
 )
+from weakref import WeakSet
 
 from envolved.absolute_name import with_prefix
 from envolved.envparser import CaseInsensitiveAmbiguityError, env_parser
@@ -82,6 +87,16 @@ unchanged = Unchanged.unchanged
 Description = Union[str, Sequence[str]]
 
 
+# resolved parsers, shared between env vars that were declared with the same type. The cache is bounded, since it holds
+# strong references to both the parser inputs and their parsers
+_cached_parser = lru_cache(maxsize=256)(parser)
+
+
+def cached_parser(t: ParserInput[T]) -> Parser[T]:
+    # parser inputs must be hashable anyway, since parser() looks them up in a dict
+    return _cached_parser(cast(Hashable, t))
+
+
 @dataclass
 class Factory(Generic[T]):
     callback: Callable[[], T]
@@ -89,24 +104,56 @@ class Factory(Generic[T]):
 
 @dataclass
 class _EnvVarResult(Generic[T]):
+    __slots__ = ("exists", "value")
+
     value: Union[T, Discard]
     exists: bool
 
 
 def unwrap_validator(func: Callable[[T], T]) -> Callable[[T], T]:
-    if isinstance(func, staticmethod):
-        func = func.__func__
+    # plain functions are the common case, so we check the exact type before falling back to isinstance
+    if type(func) is staticmethod or (type(func) is not FunctionType and isinstance(func, staticmethod)):
+        return func.__func__
     return func
 
 
+def compose_validators(validators: Sequence[Callable[[T], T]]) -> Optional[Callable[[T], T]]:
+    """
+    Combine validators into a single callable, or None if there are no validators.
+    """
+    if not validators:
+        return None
+    if len(validators) == 1:
+        return validators[0]
+
+    def composed(value: T) -> T:
+        for validator in validators:
+            value = validator(value)
+        return value
+
+    return composed
+
+
+def _missing_env_error(key: str, cause: BaseException) -> MissingEnvError:
+    """
+    A MissingEnvError to be returned rather than raised, chained to its cause as if it had been raised from it
+    """
+    ret = MissingEnvError(key)
+    ret.__cause__ = cause
+    return ret
+
+
 class EnvVar(Generic[T], ABC):
+    __slots__ = ("__weakref__", "_validate", "_validators", "default", "description", "monkeypatch")
+
     def __init__(
         self,
         default: Union[T, Factory[T], Missing, Discard],
         description: Optional[Description],
         validators: Iterable[Callable[[T], T]] = (),
     ):
-        self._validators: List[Callable[[T], T]] = [unwrap_validator(v) for v in validators]
+        self._validators: Tuple[Callable[[T], T], ...] = tuple(unwrap_validator(v) for v in validators)
+        self._validate = compose_validators(self._validators)
         self.default = default
         self.description = description
         self.monkeypatch: Union[T, Missing, Discard, NoPatch] = no_patch
@@ -117,20 +164,30 @@ class EnvVar(Generic[T], ABC):
                 key = getattr(self, "key", self)
                 raise MissingEnvError(key)
             return self.monkeypatch  # type: ignore[return-value]
-        return self._get_validated(**kwargs).value  # type: ignore[return-value]
+        result = self._get_validated(**kwargs)
+        if isinstance(result, MissingEnvError):
+            raise result
+        return result.value  # type: ignore[return-value]
 
     def validator(self, validator: Callable[[T], T]) -> EnvVar[T]:
-        self._validators.append(validator)
+        self._validators = (*self._validators, unwrap_validator(validator))
+        self._validate = compose_validators(self._validators)
         return self
 
-    def _get_validated(self, **kwargs: Any) -> _EnvVarResult[T]:
+    def _get_validated(self, **kwargs: Any) -> Union[_EnvVarResult[T], MissingEnvError]:
+        """
+        Missing values are returned as (unraised) MissingEnvErrors, raising them is left to the caller
+        """
         try:
             value = self._get(**kwargs)
         except SkipDefault as sd:
-            raise sd.args[0] from None
+            return sd.args[0]
         except MissingEnvError as mee:
+            # subclasses may raise the error instead of returning it
+            value = mee
+        if isinstance(value, MissingEnvError):
             if self.default is missing:
-                raise mee
+                return value
 
             default: Union[T, Discard]
             if isinstance(self.default, Factory):
@@ -139,13 +196,15 @@ class EnvVar(Generic[T], ABC):
                 default = self.default
 
             return _EnvVarResult(default, exists=False)
-        for validator in self._validators:
-            value = validator(value)
+        if self._validate is not None:
+            value = self._validate(value)
         return _EnvVarResult(value, exists=True)
 
     @abstractmethod
-    def _get(self, **kwargs: Any) -> T:
-        pass
+    def _get(self, **kwargs: Any) -> Union[T, MissingEnvError]:
+        """
+        Should return (not raise) a MissingEnvError if the value is missing
+        """
 
     @abstractmethod
     def with_prefix(
@@ -162,9 +221,12 @@ class EnvVar(Generic[T], ABC):
         pass
 
     def _get_descendants(self) -> Iterable[EnvVar]:
-        for child in self._get_children():
-            yield child
-            yield from child._get_descendants()
+        # an iterative pre-order traversal, the stack is popped from the end so children are pushed in reverse
+        stack = list(reversed(tuple(self._get_children())))
+        while stack:
+            descendant = stack.pop()
+            yield descendant
+            stack.extend(reversed(tuple(descendant._get_children())))
 
     @contextmanager
     def patch(self, value: Union[T, Missing, Discard]) -> Iterator[None]:
@@ -177,6 +239,8 @@ class EnvVar(Generic[T], ABC):
 
 
 class SingleEnvVar(EnvVar[T]):
+    __slots__ = ("_key", "_normalized_key", "_type", "_upper_key", "case_sensitive", "strip_whitespaces")
+
     def __init__(
         self,
         key: str,
@@ -189,8 +253,13 @@ class SingleEnvVar(EnvVar[T]):
         validators: Iterable[Callable[[T], T]] = (),
     ):
         super().__init__(default, description, validators)
-        self._key = key
-        self._type = parser(type)
+        # interning the key speeds up environment lookups, str subclasses (like AbsoluteName) can't be interned
+        # (we check __class__ since the type builtin is shadowed here)
+        self._key = sys.intern(key) if key.__class__ is str else key
+        # the uppercased key is used for sorting and grouping when describing, interning it makes comparisons cheaper
+        self._upper_key = sys.intern(key.upper())
+        self._normalized_key = env_parser.normalize_key(key)
+        self._type = cached_parser(type)
         self.case_sensitive = case_sensitive
         self.strip_whitespaces = strip_whitespaces
 
@@ -202,17 +271,24 @@ class SingleEnvVar(EnvVar[T]):
     def type(self) -> Parser[T]:
         return self._type
 
-    def _get(self, **kwargs: Any) -> T:
-        try:
-            raw_value = env_parser.get(self.case_sensitive, self._key)
-        except KeyError as err:
-            raise MissingEnvError(self._key) from err
-        except CaseInsensitiveAmbiguityError as cia:
-            raise RuntimeError(f"environment error: cannot choose between environment variables {cia.args[0]}") from cia
+    def _get(self, **kwargs: Any) -> Union[T, MissingEnvError]:
+        # an exact match is always preferred, so we only need the parser if there is none
+        raw_value = getenv(self._key)
+        if raw_value is None:
+            if self.case_sensitive:
+                return _missing_env_error(self._key, KeyError(self._key))
+            try:
+                raw_value = env_parser.get_case_insensitive(self._key, self._normalized_key)
+            except KeyError as err:
+                return _missing_env_error(self._key, err)
+            except CaseInsensitiveAmbiguityError as cia:
+                raise RuntimeError(
+                    f"environment error: cannot choose between environment variables {cia.args[0]}"
+                ) from cia
 
         if self.strip_whitespaces:
             raw_value = raw_value.strip()
-        return self.type(raw_value, **kwargs)
+        return self._type(raw_value, **kwargs)
 
     def with_prefix(
         self,
@@ -252,6 +328,8 @@ class SingleEnvVar(EnvVar[T]):
 
 
 class SchemaEnvVar(EnvVar[T]):
+    __slots__ = ("_args", "_args_view", "_children", "_descendants", "_eval_plan", "_on_partial", "_pos_args", "_type")
+
     def __init__(
         self,
         keys: Mapping[str, EnvVar[Any]],
@@ -264,8 +342,18 @@ class SchemaEnvVar(EnvVar[T]):
         pos_args: Sequence[EnvVar[Any]] = (),
     ):
         super().__init__(default, description, validators)
-        self._args = keys
-        self._pos_args = pos_args
+        # the arguments are copied, since the evaluation plan and children below are computed from them once
+        self._args = dict(keys)
+        self._args_view = MappingProxyType(self._args)
+        self._pos_args = tuple(pos_args)
+        # positional arguments are evaluated first, and are marked with a None key
+        self._eval_plan: Tuple[Tuple[Optional[str], EnvVar[Any]], ...] = (
+            *((None, v) for v in self._pos_args),
+            *self._args.items(),
+        )
+        self._children = (*self._args.values(), *self._pos_args)
+        # the children never change, and their own descendants are already computed, so we can compute ours eagerly
+        self._descendants = tuple(chain.from_iterable((child, *child._get_descendants()) for child in self._children))
         self._type = type
         self.on_partial = on_partial
 
@@ -275,11 +363,11 @@ class SchemaEnvVar(EnvVar[T]):
 
     @property
     def args(self) -> Mapping[str, EnvVar[Any]]:
-        return MappingProxyType(self._args)
+        return self._args_view
 
     @property
     def pos_args(self) -> Sequence[EnvVar[Any]]:
-        return tuple(self._pos_args)
+        return self._pos_args
 
     @property
     def on_partial(self) -> Union[T, Missing, AsDefault, Discard, Factory[T]]:
@@ -291,36 +379,41 @@ class SchemaEnvVar(EnvVar[T]):
             raise TypeError("on_partial cannot be as_default if default is missing")
         self._on_partial = value
 
-    def _get(self, **kwargs: Any) -> T:
+    def _get(self, **kwargs: Any) -> Union[T, MissingEnvError]:
         pos_values = []
         kw_values = kwargs
         any_exist = False
+        pos_discarded = False
+        # unless on_partial is as_default, the result is decided as soon as one argument is missing and another exists
+        may_short_circuit = self.on_partial is not as_default
         errs: List[MissingEnvError] = []
-        for env_var in self._pos_args:
-            try:
-                result = env_var._get_validated()  # noqa: SLF001
-            except MissingEnvError as e:  # noqa: PERF203
-                errs.append(e)
-            else:
-                if result.value is discard:
-                    break
-                pos_values.append(result.value)
-                if result.exists:
-                    any_exist = True
-        for key, env_var in self._args.items():
-            if key in kw_values:
+        for key, env_var in self._eval_plan:
+            if key is None:
+                # positional argument
+                if pos_discarded:
+                    continue
+            elif key in kw_values:
                 # key could be in kwargs because it was passed in as a positional argument, if so, we don't want to
                 # overwrite it
                 continue
-            try:
-                result = env_var._get_validated()  # noqa: SLF001
-            except MissingEnvError as e:
-                errs.append(e)
-            else:
-                if result.value is not discard:
-                    kw_values[key] = result.value
-                if result.exists:
-                    any_exist = True
+            result = env_var._get_validated()  # noqa: SLF001
+            if isinstance(result, MissingEnvError):
+                errs.append(result)
+                if any_exist and may_short_circuit:
+                    break
+                continue
+            if key is None:
+                if result.value is discard:
+                    # all positional arguments after a discarded one are discarded as well
+                    pos_discarded = True
+                    continue
+                pos_values.append(result.value)
+            elif result.value is not discard:
+                kw_values[key] = result.value
+            if result.exists:
+                any_exist = True
+                if errs and may_short_circuit:
+                    break
 
         if errs:
             if self.on_partial is not as_default and any_exist:
@@ -329,7 +422,7 @@ class SchemaEnvVar(EnvVar[T]):
                 if isinstance(self.on_partial, Factory):
                     return self.on_partial.callback()
                 return self.on_partial  # type: ignore[return-value]
-            raise errs[0]
+            return errs[0]
         return self._type(*pos_values, **kw_values)
 
     def with_prefix(
@@ -363,7 +456,10 @@ class SchemaEnvVar(EnvVar[T]):
         )
 
     def _get_children(self) -> Iterable[EnvVar[Any]]:
-        return chain(self._args.values(), self._pos_args)
+        return self._children
+
+    def _get_descendants(self) -> Iterable[EnvVar]:
+        return self._descendants
 
 
 @overload
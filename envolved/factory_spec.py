@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from inspect import Parameter, signature
 from itertools import zip_longest
-from typing import Any, Callable, Dict, Optional, Sequence, Type, Union, get_type_hints
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Sequence, Type, Union, cast, get_type_hints
 
 missing = object()
 
@@ -60,17 +62,17 @@ class Env:
 @dataclass
 class FactorySpec:
     positional: Sequence[FactoryArgSpec]
-    keyword: Dict[str, FactoryArgSpec]
+    keyword: Mapping[str, FactoryArgSpec]
 
     def merge(self, other: FactorySpec) -> FactorySpec:
         positionals = [FactoryArgSpec.merge(a, b) for a, b in zip_longest(self.positional, other.positional)]
-        keyword = {
-            k: FactoryArgSpec.merge(self.keyword.get(k), other.keyword.get(k))
-            for k in {*self.keyword.keys(), *other.keyword.keys()}
-        }
+        keyword = {k: FactoryArgSpec.merge(a, other.keyword.get(k)) for k, a in self.keyword.items()}
+        # keys that only appear in the other spec are taken as is
+        for k, b in other.keyword.items():
+            keyword.setdefault(k, b)
         return FactorySpec(
-            positional=positionals,
-            keyword=keyword,
+            positional=tuple(positionals),
+            keyword=MappingProxyType(keyword),
         )
 
 
@@ -81,24 +83,45 @@ def compat_get_type_hints(obj: Any) -> Dict[str, Any]:
 
 
 def factory_spec(factory: Union[Callable[..., Any], Type], skip_pos: int = 0) -> FactorySpec:
+    try:
+        hash(factory)
+    except TypeError:
+        # the factory is unhashable, and cannot be cached
+        return _factory_spec(factory, skip_pos)
+    return _cached_factory_spec(cast(Hashable, factory), skip_pos)
+
+
+def _factory_spec(factory: Union[Callable[..., Any], Type], skip_pos: int) -> FactorySpec:
     if isinstance(factory, type):
         initial_mapping = {
             k: FactoryArgSpec.from_type_annotation(getattr(factory, k, missing), v)
             for k, v in compat_get_type_hints(factory).items()
         }
-        cls_spec = FactorySpec(positional=(), keyword=initial_mapping)
+        cls_spec = FactorySpec(positional=(), keyword=MappingProxyType(initial_mapping))
+        if factory.__init__ is object.__init__ and factory.__new__ is object.__new__:  # type: ignore[misc]
+            # the class doesn't define a constructor, so there is nothing more to introspect
+            return cls_spec
         init_spec = factory_spec(factory.__init__, skip_pos=1)  # type: ignore[misc]
         new_spec = factory_spec(factory.__new__, skip_pos=1)
         # we arbitrarily decide that __init__ wins over __new__
         return init_spec.merge(new_spec).merge(cls_spec)
 
+    if factory is object.__init__ or factory is object.__new__:
+        # inherited by most classes, and take no arguments other than the instance/class
+        return FactorySpec((), MappingProxyType({}))
+
     type_hints = compat_get_type_hints(factory)
     sign = signature(factory)
     pos = []
     kwargs = {}
+    to_skip = skip_pos
     for param in sign.parameters.values():
         if param.kind not in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY, Parameter.POSITIONAL_ONLY):
             continue
+        if to_skip and param.kind != Parameter.KEYWORD_ONLY:
+            # skipped parameters (like self) are bound by the caller, and can't be passed by the user at all
+            to_skip -= 1
+            continue
         if param.default is not Parameter.empty:
             default = param.default
         else:
@@ -110,6 +133,10 @@ def factory_spec(factory: Union[Callable[..., Any], Type], skip_pos: int = 0) ->
             pos.append(arg_spec)
 
         kwargs[param.name] = arg_spec
-    if skip_pos:
-        del pos[:skip_pos]
-    return FactorySpec(pos, kwargs)
+    return FactorySpec(tuple(pos), MappingProxyType(kwargs))
+
+
+# introspecting a factory is expensive, and the same factories are often used for many env vars. The cache is bounded,
+# since a cached spec can refer back to its factory (through type hints or defaults) and keep it alive, and the cached
+# specs are immutable since they are shared between callers
+_cached_factory_spec = lru_cache(maxsize=256)(_factory_spec)
@@ -1,8 +1,15 @@
 from textwrap import dedent
 from types import SimpleNamespace
 
+from pytest import raises
+
 from envolved import env_var
-from envolved.describe import describe_env_vars, exclude_from_description
+from envolved.describe import (
+    EnvVarsDescription,
+    describe_env_vars,
+    exclude_from_description,
+    roots_to_exclude_from_description,
+)
 
 
 def test_describe():
@@ -70,3 +77,33 @@ def test_describe():
         "  T_P_X: x coordinate",
         "  T_P_Y: y coordinate",
     ]
+
+
+def test_describe_after_description_change():
+    a = env_var("a", type=str, description="first description")
+    assert EnvVarsDescription([a]).nested().wrap() == ["A: first description"]
+    assert EnvVarsDescription([a]).nested().wrap() == ["A: first description"]
+    a.description = "second description"
+    assert EnvVarsDescription([a]).nested().wrap() == ["A: second description"]
+    assert EnvVarsDescription([a]).flat().wrap_sorted() == ["A: second description"]
+
+
+def test_describe_schema_after_description_change():
+    p = env_var("p_", type=SimpleNamespace, args={"x": env_var("x", type=int)}, description="first point")
+    assert EnvVarsDescription([p]).nested().wrap() == ["first point:", " P_X"]
+    p.description = "second point"
+    assert EnvVarsDescription([p]).nested().wrap() == ["second point:", " P_X"]
+
+
+def test_describe_explicit_roots():
+    p = env_var("p_", type=SimpleNamespace, args={"x": env_var("x", type=int), "y": env_var("y", type=int)})
+    x, y = p._get_children()
+    a = env_var("a", type=int)
+    assert EnvVarsDescription([x, a, p, y, p]).env_var_roots == {a, p}
+
+
+def test_exclude_unrecognized_type():
+    a = env_var("a", type=int)
+    with raises(TypeError):
+        exclude_from_description([a, 1])
+    assert a not in roots_to_exclude_from_description
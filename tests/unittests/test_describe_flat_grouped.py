@@ -1,3 +1,4 @@
+from itertools import chain
 from textwrap import dedent
 from types import SimpleNamespace
 
@@ -5,6 +6,7 @@ from pytest import mark
 
 from envolved import env_var
 from envolved.describe import EnvVarsDescription
+from envolved.describe.flat import FlatEnvVarsDescription, SingleEnvVarDescription
 
 
 def test_describe_single_flat():
@@ -144,3 +146,12 @@ def test_describe_multi_flat_dragup(schema_desc):
         "B: Apple",
         "D: Bee",
     ]
+
+
+def test_describe_flat_from_generator():
+    env_vars = [env_var("b", type=int, description="Bee"), env_var("a", type=int, description="Apple")]
+    d = FlatEnvVarsDescription(chain.from_iterable(SingleEnvVarDescription.from_envvar((), ev) for ev in env_vars))
+
+    for _ in range(2):
+        assert d.wrap_grouped() == ["A: Apple", "B: Bee"]
+        assert d.wrap_sorted() == ["A: Apple", "B: Bee"]
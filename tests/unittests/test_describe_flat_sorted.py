@@ -1,7 +1,7 @@
 from textwrap import dedent
 from types import SimpleNamespace
 
-from pytest import mark
+from pytest import mark, warns
 
 from envolved import env_var
 from envolved.describe import EnvVarsDescription
@@ -275,3 +275,26 @@ def test_describe_flat_collision_warning_dup():
         "X: ex",
         "X: x coordinate",
     ]
+
+
+def test_describe_flat_collision_warning_list_descriptions():
+    d = EnvVarsDescription(
+        [
+            env_var(
+                "",
+                type=SimpleNamespace,
+                args={
+                    "x": env_var("x", type=int, description=["ex", "the x"]),
+                },
+            ),
+            env_var("x", type=int, description=["x coordinate"]),
+        ]
+    ).flat()
+
+    with warns(UserWarning, match="multiple descriptions"):
+        lines = d.wrap_sorted()
+
+    assert lines in (
+        ["X: ex", "   the x"],
+        ["X: x coordinate"],
+    )
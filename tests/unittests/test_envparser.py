@@ -1,4 +1,4 @@
-from os import name
+from os import name, putenv, unsetenv
 
 from pytest import raises, skip
 
@@ -22,3 +22,38 @@ def test_exact_override(monkeypatch):
     assert env_parser.get(False, "a") == "1"
     monkeypatch.delenv("a")
     assert env_parser.get(False, "a") == "0"
+
+
+def test_get_case_insensitive(monkeypatch):
+    normalized = env_parser.normalize_key("a")
+    with raises(KeyError):
+        env_parser.get_case_insensitive("a", normalized)
+    monkeypatch.setenv("A", "0")
+    assert env_parser.get_case_insensitive("a", normalized) == "0"
+
+
+def test_lazy_case_insensitive_map(monkeypatch):
+    # new parsers would register audit hooks that can never be removed, so we reset the global parser instead
+    monkeypatch.setattr(env_parser, "environ_case_insensitive", None)
+    monkeypatch.setenv("A", "0")
+    assert env_parser.get(False, "A") == "0"
+    assert env_parser.environ_case_insensitive is None
+    assert env_parser.get(False, "a") == "0"
+    assert env_parser.environ_case_insensitive is not None
+    monkeypatch.setenv("b", "1")
+    assert env_parser.get(False, "B") == "1"
+
+
+def test_stale_case_insensitive_map(monkeypatch):
+    monkeypatch.setattr(env_parser, "environ_case_insensitive", None)
+    with raises(KeyError):
+        env_parser.get(False, "c")
+    # putenv bypasses os.environ, so the map learns of a key that getenv can't see
+    putenv("c", "x")
+    try:
+        assert "c" in env_parser.environ_case_insensitive["c"]
+        with raises(KeyError):
+            env_parser.get(False, "C")
+        assert "c" not in env_parser.environ_case_insensitive
+    finally:
+        unsetenv("c")
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+
+import envolved
+
+
+def test_lazy_attributes():
+    for name in envolved.__all__:
+        assert getattr(envolved, name) is not None
+
+
+def test_dir():
+    assert set(dir(envolved)) >= set(envolved.__all__)
+
+
+def test_missing_attribute():
+    assert not hasattr(envolved, "not_an_attribute")
+
+
+def test_submodule_attributes():
+    # other tests import the submodules, so we check in a fresh interpreter
+    code = "import envolved; envolved.describe.exclude_from_description; envolved.parsers.LookupParser"
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_dir_includes_globals():
+    assert "__version__" in dir(envolved)
+    assert "__name__" in dir(envolved)
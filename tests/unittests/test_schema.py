@@ -1,14 +1,18 @@
+import gc
+import weakref
 from dataclasses import dataclass
 from enum import Enum, auto
 from types import SimpleNamespace
 from typing import Any, NamedTuple, Optional
+from unittest.mock import MagicMock
 
 from pytest import mark, raises, skip
 from typing_extensions import Annotated
 
 from envolved import Factory, MissingEnvError, as_default, env_var, missing
-from envolved.envvar import discard, inferred_env_var
-from envolved.factory_spec import Env
+from envolved.describe import EnvVarsDescription
+from envolved.envvar import SchemaEnvVar, discard, inferred_env_var
+from envolved.factory_spec import Env, factory_spec
 
 
 class NamedTupleClass(NamedTuple):
@@ -307,6 +311,23 @@ def test_partial_schema_ok_with_default(monkeypatch, A):
     assert a_pos.get() == []
 
 
+def test_partial_schema_short_circuit(monkeypatch):
+    c_parser = MagicMock(return_value="c")
+    a = env_var(
+        "a_",
+        type=SimpleNamespace,
+        default=None,
+        args={"a": env_var("A", type=str), "b": env_var("B", type=str), "c": env_var("C", type=c_parser)},
+        on_partial=Factory(list),
+    )
+
+    monkeypatch.setenv("a_a", "hi")
+    monkeypatch.setenv("a_c", "blue")
+
+    assert a.get() == []
+    c_parser.assert_not_called()
+
+
 @a
 def test_schema_all_missing_with_default(monkeypatch, A):
     a = env_var(
@@ -581,3 +602,115 @@ def test_ellipsis_args(monkeypatch):
     monkeypatch.setenv("a_Z", "bar")
 
     assert a.get() == A("hi", 36.5, "bar", "")
+
+
+def test_args_views():
+    a = env_var(
+        "a_", type=lambda *args, **kwargs: None, args={"x": env_var("x", type=int)}, pos_args=(env_var("y", type=int),)
+    )
+    assert a.args is a.args
+    assert a.pos_args is a.pos_args
+    assert list(a.args) == ["x"]
+    assert len(a.pos_args) == 1
+    with raises(TypeError):
+        a.args["z"] = env_var("z", type=int)
+
+
+def test_descendants():
+    inner = env_var("inner_", type=SimpleNamespace, args={"y": env_var("y", type=int), "z": env_var("z", type=int)})
+    outer = env_var("outer_", type=SimpleNamespace, args={"x": env_var("x", type=int), "inner": inner})
+    x, outer_inner = outer._get_children()
+    y, z = outer_inner._get_children()
+    assert [d.key for d in (x, y, z)] == ["outer_x", "outer_inner_y", "outer_inner_z"]
+    assert list(outer._get_descendants()) == [x, outer_inner, y, z]
+    assert list(outer_inner._get_descendants()) == [y, z]
+    assert list(x._get_descendants()) == []
+
+
+def test_unhashable_factory(monkeypatch):
+    class UnhashableMeta(type):
+        def __eq__(cls, other):
+            return cls is other
+
+        __hash__ = None
+
+    class Point(metaclass=UnhashableMeta):
+        def __init__(self, x: Annotated[int, Env(key="x")]):
+            self.x = x
+
+    a = env_var("a_", type=Point, args=...)
+    monkeypatch.setenv("a_x", "12")
+    assert a.get().x == 12
+
+
+def test_top_level_registration():
+    x = env_var("x", type=int)
+    assert x in EnvVarsDescription().env_var_roots
+    schema = SchemaEnvVar({"x": x}, type=SimpleNamespace)
+    # only registered env vars are described, so the children of an unregistered schema remain top-level
+    assert x in EnvVarsDescription().env_var_roots
+    assert schema not in EnvVarsDescription().env_var_roots
+    outer = env_var("outer_", type=SimpleNamespace, args={"inner": env_var("inner_", type=SimpleNamespace, args=...)})
+    roots = EnvVarsDescription().env_var_roots
+    assert outer in roots
+    assert not any(d in roots for d in outer._get_descendants())
+
+
+def test_orphaned_children_are_top_level():
+    p = env_var("p_", type=SimpleNamespace, args={"a": env_var("a", type=int)})
+    child = p.args["a"]
+    assert child not in EnvVarsDescription().env_var_roots
+    del p
+    gc.collect()
+    assert child in EnvVarsDescription().env_var_roots
+
+
+def test_factory_spec_skips_bound_args():
+    class A:
+        def __init__(self, a: int, *, b: str = "x"):
+            pass
+
+    spec = factory_spec(A)
+    assert [p.type for p in spec.positional] == [int]
+    assert list(spec.keyword) == ["a", "b"]
+    assert spec.keyword["b"].default == "x"
+
+
+def test_schema_args_are_copied(monkeypatch):
+    x = env_var("x", type=int)
+    y = env_var("y", type=int)
+    keys = {"x": x}
+    schema = SchemaEnvVar(keys, type=lambda *a, **k: (a, k), pos_args=(v for v in [y]))
+    keys["z"] = env_var("z", type=int)
+    monkeypatch.setenv("x", "1")
+    monkeypatch.setenv("y", "2")
+    assert schema.args == {"x": x}
+    assert schema.pos_args == (y,)
+    assert schema.get() == ((2,), {"x": 1})
+
+
+def test_factory_spec_cache_is_bounded():
+    class A:
+        def __init__(self, a: int):
+            pass
+
+    class Node:
+        parent: Optional[object] = None
+
+        def __init__(self, parent: Optional[object]):
+            pass
+
+    # a default that is an instance of the factory makes its spec refer back to the factory
+    Node.parent = Node(None)
+
+    spec = factory_spec(A)
+    assert factory_spec(A) is spec
+    with raises(TypeError):
+        spec.keyword["b"] = spec.keyword["a"]  # type: ignore[index]
+    assert isinstance(factory_spec(Node).keyword["parent"].default, Node)
+    refs = [weakref.ref(A), weakref.ref(Node)]
+    del A, Node
+    for _ in range(1000):
+        factory_spec(lambda: None)
+    gc.collect()
+    assert all(ref() is None for ref in refs)
@@ -1,9 +1,14 @@
+import gc
 import sys
+import weakref
+from typing import List
 from unittest.mock import MagicMock, call
 
+from pydantic import TypeAdapter
 from pytest import mark, raises
 
 from envolved import EnvVar, Factory, MissingEnvError, env_var
+from envolved.envvar import cached_parser
 
 
 def test_get_int(monkeypatch):
@@ -57,8 +62,9 @@ def test_default_factory(monkeypatch):
 def test_missing(monkeypatch):
     monkeypatch.delenv("t", raising=False)
     t = env_var("t", type=str)
-    with raises(MissingEnvError):
+    with raises(MissingEnvError) as exc_info:
         t.get()
+    assert isinstance(exc_info.value.__cause__, KeyError)
 
 
 def test_validators(monkeypatch):
@@ -72,6 +78,29 @@ def test_validators(monkeypatch):
     assert t.get() == 17
 
 
+def test_multiple_validators(monkeypatch):
+    monkeypatch.setenv("t", "16")
+    t = env_var("T", type=int, validators=[lambda x: x + 1])
+
+    @t.validator
+    def double(x):
+        return x * 2
+
+    assert t.get() == 34
+
+
+def test_staticmethod_validator(monkeypatch):
+    monkeypatch.setenv("t", "16")
+    t = env_var("T", type=int)
+
+    @t.validator
+    @staticmethod
+    def add_one(x):
+        return x + 1
+
+    assert t.get() == 17
+
+
 def test_validators_default(monkeypatch):
     monkeypatch.delenv("t", raising=False)
     t = env_var("T", type=int, default=None)
@@ -89,8 +118,9 @@ def test_case_sensitive_missing(monkeypatch):
 
     t0 = env_var("AB", type=str, case_sensitive=True)
 
-    with raises(MissingEnvError):
+    with raises(MissingEnvError) as exc_info:
         t0.get()
+    assert isinstance(exc_info.value.__cause__, KeyError)
 
 
 @mark.skipif(sys.platform == "win32", reason="windows is always case-insensitive")
@@ -210,3 +240,34 @@ def test_get_with_args_optional(monkeypatch):
     monkeypatch.setenv("a", "na")
     assert a.get(mul=5) == "nanananana"
     assert a.get() == "na"
+
+
+def test_shared_parser():
+    adapter = TypeAdapter(List[int])
+    a = env_var("a", type=adapter)
+    b = env_var("b", type=adapter)
+    assert a.type is b.type
+
+
+def test_parser_cache_is_bounded():
+    def parse(x):
+        return x
+
+    ref = weakref.ref(parse)
+    env_var("a", type=parse)
+    for _ in range(1000):
+        cached_parser(lambda x: x)
+    del parse
+    gc.collect()
+    assert ref() is None
+
+
+def test_unhashable_parser():
+    class UnhashableParser:
+        __hash__ = None
+
+        def __call__(self, x):
+            return x
+
+    with raises(TypeError):
+        env_var("a", type=UnhashableParser())